@@ -1,6 +1,26 @@
-import machine, time
+import machine, micropython, time
 from machine import I2C
 
+_B_C5 = bytes([0xc5]) # magic byte for the update registers (0x2b, 0x2c, 0x2d, 0x3f)
+
+# led scope bits; a scope is the OR of the leds it addresses
+# an integer AND is a single instruction, a substring scan is not
+_R = 0b0001
+_G = 0b0010
+_B = 0b0100
+_W = 0b1000
+_RGB = _R | _G | _B
+_SCOPE_MASKS = {'r':_R, 'g':_G, 'b':_B, 'w':_W, 'rgb':_RGB}
+
+@micropython.viper
+def _fill_pwm(buf: ptr8, value: int):
+    '''
+    splits a 12 bit duty cycle into the chip's low byte / high nibble pair
+    viper compiles this to plain integer ops, no interpreter involved
+    '''
+    buf[0] = value & 0xFF
+    buf[1] = (value >> 8) & 0xFF
+
 class IS31FL3197:
     '''
     i2c driver to the IS31FL3197 chip
@@ -72,7 +92,7 @@ class IS31FL3197:
         '''
         def __init__(self, chip, scope):
             self._chip = chip
-            self._scope = scope
+            self._scope = _SCOPE_MASKS[scope]
             self._intensity = 0
 
         def on(self):
@@ -80,14 +100,14 @@ class IS31FL3197:
             intensity, pwm and current band to the max
             '''
             self._intensity = 255
-            self._chip._config_led(self._intensity, 4095, 4, self._scope)
+            self._chip.set_state(self._scope, self._intensity, 4095, 4)
 
         def off(self):
             '''
-            intensity, pwm, current band to the min 
+            intensity, pwm, current band to the min
             '''
             self._intensity = 0
-            self._chip._config_led(self._intensity, 0, 1, self._scope)
+            self._chip.set_state(self._scope, self._intensity, 0, 1)
 
         def intensity(self, intensity_setting):
             '''
@@ -109,7 +129,10 @@ class IS31FL3197:
             self._chip._config_current_limit_band(band, self._scope)
 
         def dim(self, percentage):
-            self._intensity = int(self._intensity * percentage/100)
+            '''
+            0..100% on whatever the intensity setting is
+            '''
+            self._intensity = self._intensity * percentage // 100
             self._chip._config_intensity(self._intensity, self._scope)
 
     class _rgb:
@@ -119,7 +142,7 @@ class IS31FL3197:
         '''
         def __init__(self, chip, scope):
             self._chip = chip
-            self._scope = scope
+            self._scope = _SCOPE_MASKS[scope]
             self._color = (0, 0, 0)
 
         def color(self, color_tuple):
@@ -127,7 +150,7 @@ class IS31FL3197:
             pwm and current band to the max
             '''
             self._color = color_tuple
-            self._chip._config_color(self._color, 4095, 4)
+            self._chip._config_rgb_bulk(self._color, 4095, 4)
 
         def pwm(self, duty_cycle):
             '''
@@ -152,21 +175,31 @@ class IS31FL3197:
             '''
             0..100% on whatever the intensity setting is
             '''
-            for i in range (3):
-                self._color[i] = int(self._color[i] * percentage/100)
-            self._chip._config_intensity(self._color, self._scope)
+            self._color = tuple(c * percentage // 100 for c in self._color)
+            self._chip._config_rgb_bulk(self._color, 4095, 4)
 
     class _pattern:
         '''
         interface to patterns
         only to be instantiated class IS31FL3197 
         '''
+        # the chip's time table; the index of each entry is its hex code
+        _TIME_THRESHOLDS = (0.03, 0.13, 0.26, 0.38, 0.51, 0.77, 1.04, 1.60,
+                            2.10, 2.60, 3.10, 4.20, 5.20, 6.20, 7.30, 8.30)
+
+        # status register bits announcing the currently active color
+        _COLOR_MASKS = ((0b00010000, 1), (0b00100000, 2), (0b01000000, 3))
+
+        _GAMMAS = {'2.4':0b00, '3.5':0b01, 'linear':0b11}
+        _HOLD_TIMES = {'T4':0b0, 'T2':0b1} # phase of pattern to stop in
+
         def __init__(self, chip, scope):
             self._chip = chip
-            self._scope = scope
+            self._scope = _SCOPE_MASKS[scope]
             self.ADDR = self._chip.ADDR
+            self._cfg = bytearray(9) # reusable burst buffer for registers 0x22..0x2a
 
-        def config( self, 
+        def config( self,
                     start_time=0.0, 
                     rise_time=0.0, 
                     hold_time=0.0, 
@@ -190,23 +223,22 @@ class IS31FL3197:
                     activate=False
                     ):
             '''
-            sends pattern config data to the chip 
+            sends pattern config data to the chip
             code in in order of register address, uses register names of documentation
+            registers 0x22..0x2a are contiguous, so the nine config bytes are packed
+            into one buffer and sent as a single auto-increment burst
             '''
             TS = self._check_time(start_time)
             T1 = self._check_time(rise_time)
-            byte = (T1 << 4) | TS
-            self._chip.i2c.writeto_mem(self.ADDR, 0x22, bytes([byte]))
+            self._cfg[0] = (T1 << 4) | TS # 0x22
 
             T2 = self._check_time(hold_time)
             T3 = self._check_time(fall_time)
-            byte = (T3 << 4) | T2
-            self._chip.i2c.writeto_mem(self.ADDR, 0x23, bytes([byte]))
-            
+            self._cfg[1] = (T3 << 4) | T2 # 0x23
+
             T4 = self._check_time(off_time)
             TP = self._check_time(between_time)
-            byte = (TP << 4) | T4
-            self._chip.i2c.writeto_mem(self.ADDR, 0x24, bytes([byte]))
+            self._cfg[2] = (TP << 4) | T4 # 0x24
 
             if crossfade:
                 if color_1: C1 = crossfade # crossfade enable
@@ -216,59 +248,49 @@ class IS31FL3197:
                 C1 = False # disable
                 C2 = False
                 C3 = False
-            byte = (C3 << 2) | (C2 << 1) | C1
-            self._chip.i2c.writeto_mem(self.ADDR, 0x25, bytes([byte]))
+            self._cfg[3] = (C3 << 2) | (C2 << 1) | C1 # 0x25
 
             TC = self._check_time(crossfade_time) # crossfade time
-            byte = TC
-            self._chip.i2c.writeto_mem(self.ADDR, 0x26, bytes([byte]))
+            self._cfg[4] = TC # 0x26
 
             if color_1: CE1 = True # color enable
-            else: CE1 = False 
+            else: CE1 = False
             if color_2: CE2 = True
-            else: CE2 = False 
+            else: CE2 = False
             if color_3: CE3 = True
             else: CE3 = False
-            byte = (CE3 << 2) | (CE2 << 1) | CE1
-            self._chip.i2c.writeto_mem(self.ADDR, 0x27, bytes([byte]))
+            self._cfg[5] = (CE3 << 2) | (CE2 << 1) | CE1 # 0x27
 
             CCT1 = self._check_cycles(cycles_1) # color loops
             CCT2 = self._check_cycles(cycles_2)
             CCT3 = self._check_cycles(cycles_3)
-            byte = (CCT3 << 4) | (CCT2 << 2) | CCT1
-            self._chip.i2c.writeto_mem(self.ADDR, 0x28, bytes([byte]))
+            self._cfg[6] = (CCT3 << 4) | (CCT2 << 2) | CCT1 # 0x28
 
-            gammas = {'2.4':0b00, '3.5':0b01, 'linear':0b11} # gamma
-            if gamma in gammas:
-                GAM = gammas[gamma]
+            if gamma in self._GAMMAS: # gamma
+                GAM = self._GAMMAS[gamma]
             else:
                 raise ValueError (f'gamma {gamma} not allowed; use \'2.4\', \'3.5\' or \'linear\'')
             MTPLT = self._check_multi_pulse_loops(multi_pulse_loops) # multi pulse loops
-            byte = (MTPLT << 4) | (GAM << 2)
-            self._chip.i2c.writeto_mem(self.ADDR, 0x29, bytes([byte]))
+            self._cfg[7] = (MTPLT << 4) | (GAM << 2) # 0x29
 
             PLT_H = times16
             PLT_L = self._check_pattern_loops(pattern_loops) # pattern loops
-            byte = (PLT_H << 7) | PLT_L
-            self._chip.i2c.writeto_mem(self.ADDR, 0x2A, bytes([byte]))
+            self._cfg[8] = (PLT_H << 7) | PLT_L # 0x2a
+
+            self._chip.i2c.writeto_mem(self.ADDR, 0x22, self._cfg)
 
-            hold_times = {'T4':0b0, 'T2':0b1} # phase of pattern to stop in
-            if hold_time_selection in hold_times:
-                HT = hold_times[hold_time_selection]
+            if hold_time_selection in self._HOLD_TIMES:
+                HT = self._HOLD_TIMES[hold_time_selection]
             else:
                 raise ValueError (f'hold_time_selection {hold_time_selection} not allowed; use T2 or T4')
-            r = self._chip.i2c.readfrom_mem(self.ADDR, 0x06, 1)
-            byte_value = r[0]
-            byte_value &= 0b11111110 
-            byte_value |= HT 
-            self._chip.i2c.writeto_mem(self.ADDR, 0x06, bytes([byte_value]))
-
-            CHF = hold_time_function # 
-            r = self._chip.i2c.readfrom_mem(self.ADDR, 0x06, 1)
-            byte_value = r[0]
-            byte_value &= 0b11111101 
-            byte_value |= CHF << 1
-            self._chip.i2c.writeto_mem(self.ADDR, 0x06, bytes([byte_value]))
+            CHF = hold_time_function
+            # HT and CHF live in the same register, so both bits go out in one write
+            byte_value = self._chip._reg06
+            byte_value &= 0b11111100
+            byte_value |= (CHF << 1) | HT
+            self._chip._buf1[0] = byte_value
+            self._chip.i2c.writeto_mem(self.ADDR, 0x06, self._chip._buf1)
+            self._chip._reg06 = byte_value
 
             if color_1: 
                 self._chip._config_color_table(1, color_1)
@@ -284,22 +306,22 @@ class IS31FL3197:
             '''
             activates pattern, requires prior call to config()
             '''
-            self._chip._config_modus('pattern', 'rgb')
-            self._chip.i2c.writeto_mem(self.ADDR, 0x2b, bytes([0xc5])) # color update register
-            self._chip.i2c.writeto_mem(self.ADDR, 0x2d, bytes([0xc5])) # pattern times update register
+            self._chip._config_modus('pattern', _RGB)
+            self._chip.i2c.writeto_mem(self.ADDR, 0x2b, _B_C5) # color update register
+            self._chip.i2c.writeto_mem(self.ADDR, 0x2d, _B_C5) # pattern times update register
         
         def stop(self):
             '''
             aborts pattern run by setting to modus pwmcl
             if no other actions inbetween, the pattern can be restarted with start()
             '''
-            self._chip._config_modus('pwmcl', 'rgb')
+            self._chip._config_modus('pwmcl', _RGB)
 
         def clb(self, band):
             '''
             1..4
             '''
-            self._chip._config_current_limit_band(band, 'rgb')
+            self._chip._config_current_limit_band(band, self._scope)
 
         def monitor(self, timeout): # [s]
             '''
@@ -315,18 +337,18 @@ class IS31FL3197:
                 if time.ticks_diff(time.ticks_ms(), start_time) > timeout * 1000:
                     print('\ntimeout reached, exiting monitoring')
                     break
+                # the fastest phase transition is 30 ms, so sampling every 2 ms
+                # loses nothing and keeps the bus (and the MCU) mostly idle
+                time.sleep_ms(2)
                 # report status
                 r = self._chip.i2c.readfrom_mem(self.ADDR, 0x0f, 1)
                 if r != r_prev:
                     state = r[0]
 
                     color = None
-                    if state & 0b00010000:
-                        color = 1
-                    if state & 0b00100000:
-                        color = 2
-                    if state & 0b01000000:
-                        color = 3
+                    for mask, nr in self._COLOR_MASKS:
+                        if state & mask:
+                            color = nr
 
                     if color and color != color_prev:
                         print(f'\nColor{color} ', end='')
@@ -342,32 +364,27 @@ class IS31FL3197:
         def _check_time(self, time):
             '''
             convenience function: maps any input between 0 and 10 (int or float) to the closest entry in the chip's table
+            binary search on the sorted class-level table, no per-call allocations
             '''
-            time_to_hex = {
-                0.03: 0x0,
-                0.13: 0x1,
-                0.26: 0x2,
-                0.38: 0x3,
-                0.51: 0x4,
-                0.77: 0x5,
-                1.04: 0x6,
-                1.60: 0x7,
-                2.10: 0x8,
-                2.60: 0x9,
-                3.10: 0xa,
-                4.20: 0xb,
-                5.20: 0xc,
-                6.20: 0xd,
-                7.30: 0xe,
-                8.30: 0xf,
-            }            
-            if 0.0 <= time <= 10:
-                closest_time = min(time_to_hex.keys(), key=lambda t: abs(t - time))
-                result = time_to_hex[closest_time]
-            else:
+            if not 0.0 <= time <= 10:
                 raise ValueError(f'time {time} not allowed; use 0 < time < 10 [s] - maps to closest time in table')
-            return result
-
+            table = self._TIME_THRESHOLDS
+            lo = 0
+            hi = len(table)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if table[mid] < time:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            # lo is the insertion point; return the index of the closer neighbour
+            if lo == len(table):
+                return lo - 1
+            if lo > 0 and time - table[lo - 1] <= table[lo] - time:
+                return lo - 1
+            return lo
+
+        @micropython.native
         def _check_cycles(self, value):
             if isinstance(value, int) and 1 <= value <= 3:
                 result = value
@@ -377,6 +394,7 @@ class IS31FL3197:
                 raise ValueError(f'nr of cycles {value} not allowed; use 1..3 or \'endless\'')
             return result
 
+        @micropython.native
         def _check_multi_pulse_loops(self, value):
             if isinstance(value, int) and 1 <= value <= 15:
                 result = value
@@ -386,6 +404,7 @@ class IS31FL3197:
                 raise ValueError(f'nr of loops {value} not allowed; use 1..15 or \'endless\'')
             return result
 
+        @micropython.native
         def _check_pattern_loops(self, value):
             if isinstance(value, int) and 1 <= value <= 64:
                 result = value
@@ -395,18 +414,61 @@ class IS31FL3197:
                 raise ValueError(f'nr of loops {value} not allowed; use 1..64 or \'endless\'')
             return result
 
+    class _batch:
+        '''
+        context manager that defers the 0x2b/0x2c update-register writes
+        while a group of config calls is in flight, then emits each at most
+        once on exit, so a logical update latches with a single 0xc5 write
+        only to be instantiated class IS31FL3197
+        '''
+        def __init__(self, chip):
+            self._chip = chip
+
+        def __enter__(self):
+            self._chip._defer_updates = True
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            chip = self._chip
+            chip._defer_updates = False
+            if exc_type is None:
+                if chip._dirty_color:
+                    chip.i2c.writeto_mem(chip.ADDR, 0x2b, _B_C5) # color update register
+                if chip._dirty_pwm:
+                    chip.i2c.writeto_mem(chip.ADDR, 0x2c, _B_C5) # pwm update register
+            chip._dirty_color = False
+            chip._dirty_pwm = False
+            return False
+
+    # current limit band bits, indexed by band number 1..4
+    _BANDS = (None, 0b00, 0b01, 0b10, 0b11)
+
     '''
     interface to the chip
     '''
     def __init__(self, address):
         # Initialize I2C bus to get to the chip
         # for the arduino giga display shield, it's I2C4 on PB6 (SCL), PH12 (SDA)
-        self.i2c = I2C(4) 
-        devices = self.i2c.scan()
-        self.ADDR = address 
-        if self.ADDR not in devices:
+        self.i2c = I2C(4)
+        self.ADDR = address
+        # probe just the chip's address for an ack instead of scanning
+        # the whole bus (one transaction instead of 127)
+        try:
+            self.i2c.writeto(self.ADDR, b'')
+        except OSError:
             raise Exception('IS31FL3197 controller chip not found')
 
+        # reusable i2c payload buffers; writing into these instead of building
+        # a fresh bytes object per register write keeps the heap quiet on the MCU
+        self._buf1 = bytearray(1)
+        self._buf2 = bytearray(2)
+        self._buf3 = bytearray(3)
+        self._buf6 = bytearray(6)
+
+        # batching state, see _batch
+        self._defer_updates = False
+        self._dirty_color = False
+        self._dirty_pwm = False
+
         self.reset()
         self.r = self._led(self, 'r')
         self.g = self._led(self, 'g')
@@ -419,26 +481,99 @@ class IS31FL3197:
         '''
         resets chip to known state
         '''
-        self.i2c.writeto_mem(self.ADDR, 0x3f, bytes([0xc5])) # reset
-        self.i2c.writeto_mem(self.ADDR, 0x01, bytes([0xf1])) # enable all outputs, sleep disable, normal operation 
+        self.i2c.writeto_mem(self.ADDR, 0x3f, _B_C5) # reset
+        self._buf1[0] = 0xf1
+        self.i2c.writeto_mem(self.ADDR, 0x01, self._buf1) # enable all outputs, sleep disable, normal operation
+        # shadow copies of the read-modify-write registers, at their reset defaults
+        # the chip never changes these on its own, so the shadows stay correct
+        # and spare us a bus read before every write
+        self._reg02 = 0x00 # modus
+        self._reg05 = 0x00 # current limit band
+        self._reg06 = 0x00 # hold time
+        # last applied modus per led; reset default is pwmcl for all of them
+        # lets _config_modus skip the bus write when nothing changes
+        self._modus_cache = {_R:'pwmcl', _G:'pwmcl', _B:'pwmcl', _W:'pwmcl'}
+
+    def set_state(self, scope, intensity, duty_cycle, band):
+        '''
+        applies a full led state (modus pwmcl, intensity 0..255,
+        duty cycle 0..4095, current limit band 1..4) in one go with the
+        minimum number of bus transactions: the modus write is skipped
+        when nothing changed and the update registers latch once each
+        scope is a bitmask as stored by the led/rgb interfaces
+        '''
+        self._config_modus('pwmcl', scope)
+        with self._batch(self):
+            self._config_intensity(intensity, scope)
+            self._config_pwm(duty_cycle, scope)
+            self._config_current_limit_band(band, scope)
 
     def _config_led(self, intensity, duty_cycle, band, scope):
         '''
         for individual leds
         '''
-        self._config_modus('pwmcl', scope)
-        self._config_intensity(intensity, scope)
-        self._config_pwm(duty_cycle, scope)
-        self._config_current_limit_band(band, scope)
+        self.set_state(scope, intensity, duty_cycle, band)
 
     def _config_color(self, color, duty_cycle, band):
         '''
         for colors from tuple
         sets modus to pwmcl for all leds
         '''
-        self._config_led(color[0], duty_cycle, band, 'r')        
-        self._config_led(color[1], duty_cycle, band, 'g')        
-        self._config_led(color[2], duty_cycle, band, 'b')  
+        self._config_rgb_bulk(color, duty_cycle, band)
+
+    def _config_rgb_bulk(self, color, duty_cycle, band):
+        '''
+        for colors from tuple, all three leds in one go
+        the intensity registers (0x10..0x12) and pwm registers (0x1a..0x1f) are
+        contiguous, so each block goes out as a single auto-increment burst and
+        the modus and band registers each get a single read-modify-write
+        instead of one per led
+        '''
+        r = int(color[0])
+        g = int(color[1])
+        b = int(color[2])
+        for byte in (r, g, b):
+            if not 0 <= byte <= 255:
+                raise ValueError (f'intensity {byte} not allowed; use 0..255')
+        value = int(duty_cycle)
+        if not 0 <= value <= 4095:
+            raise ValueError (f'duty cycle {duty_cycle} not allowed; use range 0..4095')
+        if not (isinstance(band, int) and 1 <= band <= 4):
+            raise ValueError (f'band {band} not allowed; use 1..4')
+        band_bits = self._BANDS[band]
+
+        # modus pwmcl for r, g and b in one write against the shadow,
+        # skipped entirely when the cache says they already are
+        cache = self._modus_cache
+        if cache[_R] != 'pwmcl' or cache[_G] != 'pwmcl' or cache[_B] != 'pwmcl':
+            byte_value = self._reg02
+            byte_value &= 0b11000000 # sets r, g and b to pwmcl at once
+            self._buf1[0] = byte_value
+            self.i2c.writeto_mem(self.ADDR, 0x02, self._buf1)
+            self._reg02 = byte_value
+            cache[_R] = cache[_G] = cache[_B] = 'pwmcl'
+
+        # current limit band for r, g and b in one write against the shadow
+        byte_value = self._reg05
+        byte_value &= 0b11000000
+        byte_value |= band_bits | (band_bits << 2) | (band_bits << 4)
+        self._buf1[0] = byte_value
+        self.i2c.writeto_mem(self.ADDR, 0x05, self._buf1)
+        self._reg05 = byte_value
+
+        # intensity and pwm as auto-increment bursts over the contiguous blocks
+        pwm_low = value & 0xFF
+        pwm_high = (value >> 8) & 0xFF
+        self._buf3[0] = r
+        self._buf3[1] = g
+        self._buf3[2] = b
+        self._buf6[0] = self._buf6[2] = self._buf6[4] = pwm_low
+        self._buf6[1] = self._buf6[3] = self._buf6[5] = pwm_high
+        with self._batch(self):
+            self.i2c.writeto_mem(self.ADDR, 0x10, self._buf3)
+            self.i2c.writeto_mem(self.ADDR, 0x1a, self._buf6)
+            self._dirty_color = True
+            self._dirty_pwm = True
 
     '''
     setting modus to 'pattern' is in pattern.start()
@@ -450,18 +585,23 @@ class IS31FL3197:
         '''
         byte = int(intensity)
         if 0 <= byte <= 255:
-            if 'r' in scope:
-                self.i2c.writeto_mem(self.ADDR, 0x10, bytes([byte]))
-            if 'g' in scope:
-                self.i2c.writeto_mem(self.ADDR, 0x11, bytes([byte]))
-            if 'b' in scope:
-                self.i2c.writeto_mem(self.ADDR, 0x12, bytes([byte]))
-            if 'w' in scope:
-                self.i2c.writeto_mem(self.ADDR, 0x13, bytes([byte]))
-            self.i2c.writeto_mem(self.ADDR, 0x2b, bytes([0xc5])) # color update register
+            self._buf1[0] = byte
+            if scope & _R:
+                self.i2c.writeto_mem(self.ADDR, 0x10, self._buf1)
+            if scope & _G:
+                self.i2c.writeto_mem(self.ADDR, 0x11, self._buf1)
+            if scope & _B:
+                self.i2c.writeto_mem(self.ADDR, 0x12, self._buf1)
+            if scope & _W:
+                self.i2c.writeto_mem(self.ADDR, 0x13, self._buf1)
+            if self._defer_updates:
+                self._dirty_color = True
+            else:
+                self.i2c.writeto_mem(self.ADDR, 0x2b, _B_C5) # color update register
         else:
             raise ValueError (f'intensity {intensity} not allowed; use 0..255')
 
+    @micropython.native
     def _config_pwm(self, duty_cycle, scope):
         '''
         for individual leds or colors
@@ -469,24 +609,25 @@ class IS31FL3197:
         '''
         value = int(duty_cycle)
         if 0 <= value <= 4095:
-            high_nibble = (value >> 8) & 0xFF
-            low_byte = value & 0xFF
-            if 'r' in scope:
-                self.i2c.writeto_mem(self.ADDR, 0x1b, bytes([high_nibble]))
-                self.i2c.writeto_mem(self.ADDR, 0x1a, bytes([low_byte]))
-            if 'g' in scope:
-                self.i2c.writeto_mem(self.ADDR, 0x1d, bytes([high_nibble]))
-                self.i2c.writeto_mem(self.ADDR, 0x1c, bytes([low_byte]))
-            if 'b' in scope:
-                self.i2c.writeto_mem(self.ADDR, 0x1f, bytes([high_nibble]))
-                self.i2c.writeto_mem(self.ADDR, 0x1e, bytes([low_byte]))
-            if 'w' in scope:
-                self.i2c.writeto_mem(self.ADDR, 0x21, bytes([high_nibble]))
-                self.i2c.writeto_mem(self.ADDR, 0x20, bytes([low_byte]))
-            self.i2c.writeto_mem(self.ADDR, 0x2c, bytes([0xc5])) # pwm update register        
+            # low byte and high nibble are at consecutive addresses, the chip
+            # auto-increments its address pointer so both go out in one transaction
+            _fill_pwm(self._buf2, value)
+            if scope & _R:
+                self.i2c.writeto_mem(self.ADDR, 0x1a, self._buf2)
+            if scope & _G:
+                self.i2c.writeto_mem(self.ADDR, 0x1c, self._buf2)
+            if scope & _B:
+                self.i2c.writeto_mem(self.ADDR, 0x1e, self._buf2)
+            if scope & _W:
+                self.i2c.writeto_mem(self.ADDR, 0x20, self._buf2)
+            if self._defer_updates:
+                self._dirty_pwm = True
+            else:
+                self.i2c.writeto_mem(self.ADDR, 0x2c, _B_C5) # pwm update register
         else:
             raise ValueError (f'duty cycle {duty_cycle} not allowed; use range 0..4095')
 
+    @micropython.native
     def _config_modus(self, modus, scope):
         '''
         for individual leds or colors
@@ -496,70 +637,83 @@ class IS31FL3197:
         modus led presets modus for individual leds, 1 at a time
         so: AFTER setting color or pattern, 1 or 2 leds can be configured to operate independantly (not the other way round)
         '''
-        r = self.i2c.readfrom_mem(self.ADDR, 0x02, 1)
-        byte_value = r[0]
+        cache = self._modus_cache
+        for bit in (_R, _G, _B, _W):
+            if scope & bit and cache[bit] != modus:
+                break
+        else:
+            return # every led in scope already runs this modus, skip the bus write
+
+        byte_value = self._reg02
 
         if modus == 'pwmcl':
-            if 'r' in scope:
+            if scope & _R:
                 byte_value &= 0b11111100  # sets last two bits to '00'
-            if 'g' in scope:
+            if scope & _G:
                 byte_value &= 0b11110011
-            if 'b' in scope:
+            if scope & _B:
                 byte_value &= 0b11001111
-            if 'w' in scope:
+            if scope & _W:
                 byte_value &= 0b10111111 # not tested !
         elif modus == 'pattern':
-            if 'r' in scope:
+            if scope & _R:
                 byte_value &= 0b11111100 # clears last two bits
                 byte_value |= 0b00000001 # sets last two bit to '01'
-            if 'g' in scope:
+            if scope & _G:
                 byte_value &= 0b11110011  
                 byte_value |= 0b00000100 
-            if 'b' in scope:
+            if scope & _B:
                 byte_value &= 0b11001111  
                 byte_value |= 0b00010000
-            if 'w' in scope:
+            if scope & _W:
                 raise ValueError (f'modus {modus} not allowed for \'w\'')
         elif modus == 'cl':
-            if 'r' in scope:
+            if scope & _R:
                 byte_value &= 0b11111100 # clears last two bits
                 byte_value |= 0b00000011 # sets last two bits to '1x'
-            if 'g' in scope:
+            if scope & _G:
                 byte_value &= 0b11110011  
                 byte_value |= 0b00001100 
-            if 'b' in scope:
+            if scope & _B:
                 byte_value &= 0b11001111  
                 byte_value |= 0b00110000 
-            if 'w' in scope:
+            if scope & _W:
                 byte_value &= 0b10111111 # not tested !
                 byte_value |= 0b01000000 
         else:
             raise ValueError (f'modus {modus} not allowed; use \'pwmcl\', \'pattern\' or \'cl\'')
-        self.i2c.writeto_mem(self.ADDR, 0x02, bytes([byte_value]))
-
+        self._buf1[0] = byte_value
+        self.i2c.writeto_mem(self.ADDR, 0x02, self._buf1)
+        self._reg02 = byte_value
+        for bit in (_R, _G, _B, _W):
+            if scope & bit:
+                cache[bit] = modus
+
+    @micropython.native
     def _config_current_limit_band(self, band, scope):
         '''
         for individual leds or colors
         puts a hard limit on the amount of current through each led
         uses 4 steps of 25% each
         '''
-        bands = {1:0b00, 2:0b01, 3:0b10, 4:0b11}
-        if band in bands:
-            r = self.i2c.readfrom_mem(self.ADDR, 0x05, 1)
-            byte_value = r[0]
-            if 'r' in scope:
+        if isinstance(band, int) and 1 <= band <= 4:
+            band_bits = self._BANDS[band]
+            byte_value = self._reg05
+            if scope & _R:
                 byte_value &= 0b11111100
-                byte_value |= bands[band] 
-            if 'g' in scope:
-                byte_value &= 0b11110011  
-                byte_value |= bands[band] << 2
-            if 'b' in scope:
-                byte_value &= 0b11001111  
-                byte_value |= bands[band] << 4
-            if 'w' in scope:
+                byte_value |= band_bits
+            if scope & _G:
+                byte_value &= 0b11110011
+                byte_value |= band_bits << 2
+            if scope & _B:
+                byte_value &= 0b11001111
+                byte_value |= band_bits << 4
+            if scope & _W:
                 byte_value &= 0b00111111 # not tested !
-                byte_value |= bands[band] << 6
-            self.i2c.writeto_mem(self.ADDR, 0x05, bytes([byte_value]))
+                byte_value |= band_bits << 6
+            self._buf1[0] = byte_value
+            self.i2c.writeto_mem(self.ADDR, 0x05, self._buf1)
+            self._reg05 = byte_value
         else:
             raise ValueError (f'band {band} not allowed; use 1..4')
      
@@ -579,10 +733,13 @@ class IS31FL3197:
         r  = int(color[0])
         g  = int(color[1])
         b  = int(color[2])
-        self.i2c.writeto_mem(self.ADDR, 0x10+offset, bytes([r]))  # red
-        self.i2c.writeto_mem(self.ADDR, 0x11+offset, bytes([g]))  # green
-        self.i2c.writeto_mem(self.ADDR, 0x12+offset, bytes([b]))  # blue
-        self.i2c.writeto_mem(self.ADDR, 0x2b, bytes([0xc5])) # color update register
+        self._buf1[0] = r
+        self.i2c.writeto_mem(self.ADDR, 0x10+offset, self._buf1)  # red
+        self._buf1[0] = g
+        self.i2c.writeto_mem(self.ADDR, 0x11+offset, self._buf1)  # green
+        self._buf1[0] = b
+        self.i2c.writeto_mem(self.ADDR, 0x12+offset, self._buf1)  # blue
+        self.i2c.writeto_mem(self.ADDR, 0x2b, _B_C5) # color update register
 
     def _config_phase_delay(self, mode):
         '''
@@ -594,8 +751,9 @@ class IS31FL3197:
         if mode in modes:
             r = self.i2c.readfrom_mem(self.ADDR, 0x07, 1)
             byte_value = r[0]
-            byte_value &= 0b11111110 
+            byte_value &= 0b11111110
             byte_value |= modes[mode]
-            self.i2c.writeto_mem(self.ADDR, 0x07, bytes([byte_value]))
+            self._buf1[0] = byte_value
+            self.i2c.writeto_mem(self.ADDR, 0x07, self._buf1)
         else:
             raise ValueError (f'mode {mode} not allowed; use \'mode1\' or \'mode2\'')